@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Friendly messages shown to users when an operation is shed
+BUSY_MESSAGE = "⏳ The portal is busy right now. Please retry in a few seconds."
+RATE_LIMITED_MESSAGE = "⏳ Too many attempts. Please wait a moment and retry."
+
+# Token-bucket limits per action: (capacity, tokens refilled per second).
+# "per_email" limits a single user, "per_action" limits the action process-wide.
+DEFAULT_LIMITS = {
+    "login":          {"per_email": (5, 5 / 60), "per_action": (30, 10.0)},
+    "register":       {"per_email": (3, 3 / 60), "per_action": (10, 2.0)},
+    "raise_issue":    {"per_email": (5, 5 / 60), "per_action": (20, 5.0)},
+    "help_request":   {"per_email": (3, 3 / 60), "per_action": (20, 5.0)},
+}
+
+# Write operations beyond this many waiting for the disk are rejected
+MAX_QUEUED_WRITES = 8
+# Seconds a queued write waits for its turn before being shed
+WRITE_TIMEOUT = 5.0
+# Hard cap on tracked per-email buckets; the least recently used are evicted first
+MAX_TRACKED_BUCKETS = 5000
+
+
+class AdmissionRejected(Exception):
+    """Raised when an operation is rate limited or shed under load."""
+
+
+class TokenBucket:
+    """A refilling token bucket. Not thread-safe; the controller locks around it."""
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated = now
+
+
+class AdmissionController:
+    """
+    Process-wide admission control for login and write actions:
+    1. Token-bucket rate limits per (action, email) and per action.
+    2. A bounded queue that serialises CSV writes and sheds load when full.
+    3. Admitted / rejected counters per action for tuning the limits.
+    """
+
+    def __init__(self, limits=None, max_queued_writes=MAX_QUEUED_WRITES, write_timeout=WRITE_TIMEOUT):
+        self.limits = limits or DEFAULT_LIMITS
+        self.max_queued_writes = max_queued_writes
+        self.write_timeout = write_timeout
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._queued_writes = 0
+        self._email_buckets = OrderedDict()
+        self._action_buckets = {}
+        self._counters = {}
+
+    def _count(self, action, outcome):
+        counts = self._counters.setdefault(action, {"admitted": 0, "rate_limited": 0, "shed": 0})
+        counts[outcome] += 1
+
+    def _bucket(self, buckets, key, limit):
+        if key not in buckets:
+            buckets[key] = TokenBucket(*limit)
+        return buckets[key]
+
+    def _email_bucket(self, key, limit):
+        # LRU with a hard cap keeps each call O(1) even when distinct emails are sprayed;
+        # an evicted email starts from a full bucket but the per-action bucket still applies
+        bucket = self._bucket(self._email_buckets, key, limit)
+        self._email_buckets.move_to_end(key)
+        while len(self._email_buckets) > MAX_TRACKED_BUCKETS:
+            self._email_buckets.popitem(last=False)
+        return bucket
+
+    def check_rate(self, action, email):
+        """Consume one token for `action` by `email` or raise AdmissionRejected."""
+        limit = self.limits.get(action)
+        if limit is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            email_bucket = self._email_bucket((action, (email or "").strip().lower()), limit["per_email"])
+            action_bucket = self._bucket(self._action_buckets, action, limit["per_action"])
+            email_bucket.refill(now)
+            action_bucket.refill(now)
+
+            # Only spend tokens when both buckets allow it
+            if email_bucket.tokens < 1 or action_bucket.tokens < 1:
+                self._count(action, "rate_limited")
+                raise AdmissionRejected(RATE_LIMITED_MESSAGE)
+
+            email_bucket.tokens -= 1
+            action_bucket.tokens -= 1
+
+    def _refund(self, action, email):
+        """Returns the tokens spent by check_rate; caller holds the lock."""
+        limit = self.limits.get(action)
+        if limit is None:
+            return
+        for bucket in (self._email_buckets.get((action, (email or "").strip().lower())),
+                       self._action_buckets.get(action)):
+            if bucket is not None:
+                bucket.tokens = min(bucket.capacity, bucket.tokens + 1)
+
+    @contextmanager
+    def admit(self, action, email, write=False):
+        """
+        Context manager guarding one operation. Read-only actions (login) are only
+        rate limited; writes also wait their turn in the bounded write queue.
+        A shed write gets its rate-limit tokens back since nothing was written.
+        """
+        self.check_rate(action, email)
+
+        if not write:
+            with self._lock:
+                self._count(action, "admitted")
+            yield
+            return
+
+        with self._lock:
+            if self._queued_writes >= self.max_queued_writes:
+                self._count(action, "shed")
+                self._refund(action, email)
+                raise AdmissionRejected(BUSY_MESSAGE)
+            self._queued_writes += 1
+
+        acquired = self._write_lock.acquire(timeout=self.write_timeout)
+        with self._lock:
+            self._queued_writes -= 1
+            self._count(action, "admitted" if acquired else "shed")
+            if not acquired:
+                self._refund(action, email)
+        if not acquired:
+            raise AdmissionRejected(BUSY_MESSAGE)
+
+        try:
+            yield
+        finally:
+            self._write_lock.release()
+
+    def stats(self):
+        """Snapshot of counters per action plus the current write queue depth."""
+        with self._lock:
+            rows = [
+                {"action": action, **counts}
+                for action, counts in sorted(self._counters.items())
+            ]
+            return {
+                "actions": rows,
+                "queued_writes": self._queued_writes,
+                "max_queued_writes": self.max_queued_writes,
+                "tracked_buckets": len(self._email_buckets),
+            }
+
+
+# Module-level singleton: Streamlit imports this once per process,
+# so every session shares the same limits and write queue.
+controller = AdmissionController()
@@ -6,6 +6,8 @@ from datetime import datetime, timedelta
 from dashboards.admin_dashboard import show_admin_dashboard
 from dashboards.tech_lead_dashboard import show_tech_lead_dashboard
 from dashboards.ai_developer_dashboard import show_ai_developer_dashboard
+from admission import controller as admission, AdmissionRejected
+from session_registry import track_current_session
 
 USERS_CSV = "data/users.csv"
 
@@ -32,21 +34,27 @@ def register_user():
                 st.error("❌ Please fill in all fields and upload your offer letter.")
                 return
 
-            users_df = pd.read_csv(USERS_CSV)
-            if email in users_df["email"].values:
-                st.error("❌ Email already registered.")
+            try:
+                with admission.admit("register", email, write=True):
+                    users_df = pd.read_csv(USERS_CSV)
+                    if email in users_df["email"].values:
+                        st.error("❌ Email already registered.")
+                        return
+
+                    new_user = pd.DataFrame([{
+                        "name": name,
+                        "email": email,
+                        "password": password,
+                        "role": role,
+                        "college": college
+                    }])
+                    users_df = pd.concat([users_df, new_user], ignore_index=True)
+
+                    users_df.to_csv(USERS_CSV, index=False)
+            except AdmissionRejected as e:
+                st.warning(str(e))
                 return
 
-            new_user = pd.DataFrame([{
-                "name": name,
-                "email": email,
-                "password": password,
-                "role": role,
-                "college": college
-            }])
-            users_df = pd.concat([users_df, new_user], ignore_index=True)
-
-            users_df.to_csv(USERS_CSV, index=False)
             st.success("✅ Registration successful! Please login.")
             st.session_state.page = "login"
 
@@ -59,7 +67,13 @@ def login_user():
         submit = st.form_submit_button("Login")
 
         if submit:
-            users_df = pd.read_csv(USERS_CSV)
+            try:
+                with admission.admit("login", email):
+                    users_df = pd.read_csv(USERS_CSV)
+            except AdmissionRejected as e:
+                st.warning(str(e))
+                return
+
             user = users_df[(users_df["email"] == email) & (users_df["password"] == password)]
 
             if not user.empty:
@@ -101,6 +115,9 @@ def main():
             logout_user()
             st.rerun()
 
+    # Record activity and memory footprint so idle sessions can be evicted in the background
+    track_current_session()
+
     # Logged-in flow
     if st.session_state.logged_in:
         st.sidebar.markdown(f"👤 **Logged in as:** {st.session_state.email}")
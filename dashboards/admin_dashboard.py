@@ -2,16 +2,23 @@ import streamlit as st
 import pandas as pd
 import os
 
+from admission import controller as admission, AdmissionRejected
+from issue_store import load_hot_issues, count_issues_by, add_issue, update_issue
+from dashboards.issue_tables import show_issues_table, select_archive_page
+from dashboards.report_panel import show_report_panel
+from session_registry import registry as session_registry
+
 # Define file paths for clarity
 USERS_CSV = "data/users.csv"
-ISSUES_CSV = "data/issues.csv"
 
 def show_admin_dashboard():
     """
-    Displays the main admin dashboard with three tabs:
+    Displays the main admin dashboard with five tabs:
     1. Intern Dashboard: View and filter registered interns.
     2. Issues: Track and manage active and completed issues.
     3. Raise Issue: Create new issues.
+    4. Reports: Generate and download per-college progress reports.
+    5. System: Admission control counters and live session memory per role.
     """
     st.title("👑 Admin Dashboard")
 
@@ -20,7 +27,7 @@ def show_admin_dashboard():
         os.makedirs("data")
 
     # Tabs for different sections
-    tab1, tab2, tab3 = st.tabs(["📋 Intern Dashboard", "🛠️ Issues", "🐞 Raise Issue"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Intern Dashboard", "🛠️ Issues", "🐞 Raise Issue", "📑 Reports", "⚙️ System"])
 
     # ----------------------
     # 📋 Intern Dashboard Tab
@@ -50,105 +57,107 @@ def show_admin_dashboard():
     with tab2:
         st.subheader("Issue Tracking")
 
-        if os.path.exists(ISSUES_CSV):
-            issues_df = pd.read_csv(ISSUES_CSV)
+        # Only the hot partition (non-Completed issues) is loaded by default
+        issues_df = load_hot_issues()
 
-            # Create sub-tabs for views
-            view1, view2, view3 = st.tabs(["🔍 Filtered View", "📊 Table View", "📈 Graph View"])
+        # Create sub-tabs for views
+        view1, view2, view3 = st.tabs(["🔍 Filtered View", "📊 Table View", "📈 Graph View"])
 
-            # --------------------
-            # 🔍 Filtered View
-            # --------------------
-            with view1:
-                st.markdown("### Filter and Search Issues")
-                show_completed = st.checkbox("Show completed issues", value=False)
+        # --------------------
+        # 🔍 Filtered View
+        # --------------------
+        with view1:
+            st.markdown("### Filter and Search Issues")
+            show_completed = st.checkbox("Show completed issues", value=False)
 
-                # Filter by status
-                filtered_df = issues_df if show_completed else issues_df[issues_df["status"] != "Completed"]
+            # Filter by status; completed issues come one archive page at a time and filters apply to that page
+            if show_completed:
+                filtered_df = pd.concat([issues_df, select_archive_page("admin-filtered")], ignore_index=True)
+            else:
+                filtered_df = issues_df
+
+            # Filter by difficulty
+            difficulty_filter = st.multiselect(
+                "Filter by Difficulty", ["Easy", "Medium", "Hard"], default=["Easy", "Medium", "Hard"]
+            )
+            filtered_df = filtered_df[filtered_df["difficulty"].isin(difficulty_filter)]
+
+            # Search by title
+            search_query = st.text_input("Search by Issue Title").lower()
+            if search_query:
+                filtered_df = filtered_df[filtered_df["title"].str.lower().str.contains(search_query)]
+
+            st.write(f"🔎 {len(filtered_df)} issues matched.")
+            if not filtered_df.empty:
+                for index, row in filtered_df.iloc[::-1].iterrows():
+                    st.markdown(f"**#{row['id']}** — {row['title']} ({row['difficulty']})")
+                    st.write(row["description"])
+                    st.write(f"Status: `{row['status']}` | Assigned To: {row.get('assigned_to', 'N/A')} | Submitter: {row.get('submitter', 'N/A')}")
+
+                    if row["status"] == "Merge Request Submitted":
+                        if st.button(f"✅ Mark as Completed", key=f"complete_filtered_{row['id']}"):
+                            update_issue(row['id'], "Completed")
+                            st.success(f"Issue #{row['id']} marked as Completed.")
+                            st.rerun()
+                    st.markdown("---")
+            else:
+                st.info("No issues matched the filters.")
+
+        # --------------------
+        # 📊 Table View
+        # --------------------
+        with view2:
+            st.markdown("### Full Issues Table")
+            show_issues_table("admin-table")
+
+        # --------------------
+        # 📈 Graph View
+        # --------------------
+        with view3:
+            st.markdown("### 📊 Issues Insights Dashboard")
+
+            import altair as alt
+
+            # Counts combine the hot partition with the cached archive summary
+            difficulty_data = count_issues_by(["difficulty"])
+            status_data = count_issues_by(["status"])
+
+            if not difficulty_data.empty:
+                # Use consistent color schemes for clarity
+                difficulty_color_scale = alt.Scale(domain=["Easy", "Medium", "Hard"],
+                                                range=["#A1D99B", "#FC9272", "#9ECAE1"])
+                status_color_scale = alt.Scale(domain=["Open", "Merge Request Submitted", "Completed"],
+                                            range=["#FEC44F", "#74C476", "#6BAED6"])
+
+                # --- Donut Chart for Difficulty ---
+                difficulty_chart = alt.Chart(difficulty_data).mark_arc(innerRadius=60, outerRadius=100).encode(
+                    theta=alt.Theta("count:Q", title=""),
+                    color=alt.Color("difficulty:N", scale=difficulty_color_scale, legend=alt.Legend(title="Difficulty")),
+                    tooltip=[alt.Tooltip("difficulty:N", title="Difficulty"),
+                            alt.Tooltip("count:Q", title="Number of Issues")]
+                ).properties(
+                    title={"text": "Issue Distribution by Difficulty", "fontSize": 16, "subtitleFontSize": 12},
+                    width=300,
+                    height=300
+                )
 
-                # Filter by difficulty
-                difficulty_filter = st.multiselect(
-                    "Filter by Difficulty", ["Easy", "Medium", "Hard"], default=["Easy", "Medium", "Hard"]
+                # --- Donut Chart for Status ---
+                status_chart = alt.Chart(status_data).mark_arc(innerRadius=60, outerRadius=100).encode(
+                    theta=alt.Theta("count:Q", title=""),
+                    color=alt.Color("status:N", scale=status_color_scale, legend=alt.Legend(title="Status")),
+                    tooltip=[alt.Tooltip("status:N", title="Status"),
+                            alt.Tooltip("count:Q", title="Number of Issues")]
+                ).properties(
+                    title={"text": "Issue Distribution by Status", "fontSize": 16, "subtitleFontSize": 12},
+                    width=300,
+                    height=300
                 )
-                filtered_df = filtered_df[filtered_df["difficulty"].isin(difficulty_filter)]
-
-                # Search by title
-                search_query = st.text_input("Search by Issue Title").lower()
-                if search_query:
-                    filtered_df = filtered_df[filtered_df["title"].str.lower().str.contains(search_query)]
-
-                st.write(f"🔎 {len(filtered_df)} issues matched.")
-                if not filtered_df.empty:
-                    for index, row in filtered_df.iloc[::-1].iterrows():
-                        st.markdown(f"**#{row['id']}** — {row['title']} ({row['difficulty']})")
-                        st.write(row["description"])
-                        st.write(f"Status: `{row['status']}` | Assigned To: {row.get('assigned_to', 'N/A')} | Submitter: {row.get('submitter', 'N/A')}")
-
-                        if row["status"] == "Merge Request Submitted":
-                            if st.button(f"✅ Mark as Completed", key=f"complete_filtered_{row['id']}"):
-                                issues_df.loc[issues_df['id'] == row['id'], "status"] = "Completed"
-                                issues_df.to_csv(ISSUES_CSV, index=False)
-                                st.success(f"Issue #{row['id']} marked as Completed.")
-                                st.rerun()
-                        st.markdown("---")
-                else:
-                    st.info("No issues matched the filters.")
-
-            # --------------------
-            # 📊 Table View
-            # --------------------
-            with view2:
-                st.markdown("### Full Issues Table")
-                st.dataframe(issues_df, use_container_width=True, hide_index=True)
-
-            # --------------------
-            # 📈 Graph View
-            # --------------------
-            with view3:
-                st.markdown("### 📊 Issues Insights Dashboard")
-
-                import altair as alt
-
-                if not issues_df.empty:
-                    # Use consistent color schemes for clarity
-                    difficulty_color_scale = alt.Scale(domain=["Easy", "Medium", "Hard"],
-                                                    range=["#A1D99B", "#FC9272", "#9ECAE1"])
-                    status_color_scale = alt.Scale(domain=["Open", "Merge Request Submitted", "Completed"],
-                                                range=["#FEC44F", "#74C476", "#6BAED6"])
-
-                    # --- Donut Chart for Difficulty ---
-                    difficulty_data = issues_df.groupby("difficulty").size().reset_index(name="count")
-
-                    difficulty_chart = alt.Chart(difficulty_data).mark_arc(innerRadius=60, outerRadius=100).encode(
-                        theta=alt.Theta("count:Q", title=""),
-                        color=alt.Color("difficulty:N", scale=difficulty_color_scale, legend=alt.Legend(title="Difficulty")),
-                        tooltip=[alt.Tooltip("difficulty:N", title="Difficulty"),
-                                alt.Tooltip("count:Q", title="Number of Issues")]
-                    ).properties(
-                        title={"text": "Issue Distribution by Difficulty", "fontSize": 16, "subtitleFontSize": 12},
-                        width=300,
-                        height=300
-                    )
-
-                    # --- Donut Chart for Status ---
-                    status_data = issues_df.groupby("status").size().reset_index(name="count")
-
-                    status_chart = alt.Chart(status_data).mark_arc(innerRadius=60, outerRadius=100).encode(
-                        theta=alt.Theta("count:Q", title=""),
-                        color=alt.Color("status:N", scale=status_color_scale, legend=alt.Legend(title="Status")),
-                        tooltip=[alt.Tooltip("status:N", title="Status"),
-                                alt.Tooltip("count:Q", title="Number of Issues")]
-                    ).properties(
-                        title={"text": "Issue Distribution by Status", "fontSize": 16, "subtitleFontSize": 12},
-                        width=300,
-                        height=300
-                    )
-
-                    # Display both charts side-by-side
-                    st.altair_chart(difficulty_chart | status_chart, use_container_width=True)
 
-                else:
-                    st.info("No issues to visualize.")
+                # Display both charts side-by-side
+                st.altair_chart(difficulty_chart | status_chart, use_container_width=True)
+
+            else:
+                st.info("No issues to visualize.")
 
 
 
@@ -158,12 +167,6 @@ def show_admin_dashboard():
     with tab3:
         st.subheader("Raise a New Issue")
 
-        # --- Improvement: Load data only once per run ---
-        if os.path.exists(ISSUES_CSV):
-            issues_df = pd.read_csv(ISSUES_CSV)
-        else:
-            issues_df = pd.DataFrame(columns=["id", "title", "description", "difficulty", "status", "assigned_to", "submitter"])
-
         # --- Improvement: Use clear_on_submit for better UX ---
         with st.form("raise_issue_form", clear_on_submit=True):
             title = st.text_input("Issue Title")
@@ -176,27 +179,65 @@ def show_admin_dashboard():
                 if not title:
                     st.warning("Please enter a title for the issue.")
                 else:
-                    # Determine the next available ID
-                    new_id = issues_df["id"].max() + 1 if not issues_df.empty else 1
-
-                    # Create a new DataFrame for the new issue
-                    new_issue = pd.DataFrame([{
-                        "id": new_id,
-                        "title": title,
-                        "description": description,
-                        "difficulty": difficulty,
-                        "status": "Open",
-                        "assigned_to": "",
-                        "submitter": "Admin"
-                    }])
-
-                    # Append new issue and save to CSV
-                    issues_df = pd.concat([issues_df, new_issue], ignore_index=True)
-                    issues_df.to_csv(ISSUES_CSV, index=False)
-
-                    # Signal to other tabs that an issue was added (optional but good practice)
-                    st.session_state.new_issue_added = True
-                    st.success("✅ Issue raised successfully!")
+                    try:
+                        with admission.admit("raise_issue", st.session_state.get("email"), write=True):
+                            # Append new issue to the hot partition
+                            add_issue(title, description, difficulty, "Admin")
+                    except AdmissionRejected as e:
+                        st.warning(str(e))
+                    else:
+                        # Signal to other tabs that an issue was added (optional but good practice)
+                        st.session_state.new_issue_added = True
+                        st.success("✅ Issue raised successfully!")
+
+    # ----------------------
+    # 📑 Reports Tab
+    # ----------------------
+    with tab4:
+        st.subheader("College Progress Reports")
+        if os.path.exists(USERS_CSV):
+            colleges = pd.read_csv(USERS_CSV, usecols=["college"])["college"].dropna().unique().tolist()
+        else:
+            colleges = []
+
+        if colleges:
+            # Reports are built in a background process pool and cached per dataset version
+            show_report_panel(colleges, key="admin-reports")
+        else:
+            st.info("No colleges registered yet.")
+
+    # ----------------------
+    # ⚙️ System Tab
+    # ----------------------
+    with tab5:
+        st.subheader("Admission Control")
+        stats = admission.stats()
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Queued Writes", stats["queued_writes"])
+        col2.metric("Write Queue Limit", stats["max_queued_writes"])
+        col3.metric("Tracked Rate Buckets", stats["tracked_buckets"])
+
+        if stats["actions"]:
+            st.dataframe(pd.DataFrame(stats["actions"]), use_container_width=True, hide_index=True)
+        else:
+            st.info("No login or write actions recorded yet.")
+
+        st.subheader("Sessions")
+        session_stats = session_registry.stats()
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Live Sessions", session_stats["total_sessions"])
+        col2.metric("Total Memory", f"{session_stats['total_kb']} KB")
+        col3.metric("Evicted (idle)", session_stats["evicted"])
+
+        if session_stats["roles"]:
+            st.dataframe(pd.DataFrame(session_stats["roles"]), use_container_width=True, hide_index=True)
+
+        last_sweep = session_stats["last_sweep"]
+        st.caption(f"🧹 Last idle-session sweep: {last_sweep:%Y-%m-%d %H:%M:%S}" if last_sweep else "🧹 No idle-session sweep has completed yet.")
+        if session_stats["last_error"]:
+            st.error(f"Last sweep failed: {session_stats['last_error']}")
 
 
 # Example of how to run the dashboard (optional, for standalone execution)
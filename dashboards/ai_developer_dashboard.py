@@ -2,8 +2,11 @@ import streamlit as st
 import pandas as pd
 import os
 
+from admission import controller as admission, AdmissionRejected
+from issue_store import load_hot_issues, archive_summary, count_issues_by, update_issue
+from dashboards.issue_tables import select_archive_page
+
 HELP_REQUESTS_CSV = "data/help_requests.csv"
-ISSUES_CSV = "data/issues.csv"
 
 def show_ai_developer_dashboard(current_user_email):
     st.title("🤖 AI Developer Dashboard")
@@ -11,10 +14,10 @@ def show_ai_developer_dashboard(current_user_email):
     developer_name = st.session_state.get("name", current_user_email)
     assigned_label = f"AI Developer - {developer_name}"
 
-    if os.path.exists(ISSUES_CSV):
-        issues_df = pd.read_csv(ISSUES_CSV)
-    else:
-        issues_df = pd.DataFrame(columns=["id", "title", "description", "difficulty", "status", "assigned_to", "submitter"])
+    # Hot partition only; Completed issues are read from the archive on demand
+    issues_df = load_hot_issues()
+    archived = archive_summary()["counts"]
+    completed = int(archived.loc[archived["assigned_to"] == assigned_label, "count"].sum())
 
     tab1, tab2, tab3, tab4 = st.tabs(["🛠 Issues", "📈 My Issues", "📊 My Insights", "🙋 Request Tech Lead Help"])
 
@@ -23,11 +26,12 @@ def show_ai_developer_dashboard(current_user_email):
         st.subheader("Browse & Claim Issues")
 
         st.markdown("### 🔍 Filter Issues")
-        status_filter = st.selectbox("Filter by Status", options=["All", "Open", "In Progress", "Completed"])
-        difficulty_filter = st.multiselect("Filter by Difficulty", options=issues_df["difficulty"].dropna().unique().tolist())
+        status_filter = st.selectbox("Filter by Status", options=["All Active", "Open", "In Progress", "Completed"])
+        difficulty_filter = st.multiselect("Filter by Difficulty", options=["Easy", "Medium", "Hard"])
 
-        filtered_issues = issues_df.copy()
-        if status_filter != "All":
+        # Completed issues are paged from the archive rather than loaded in full
+        filtered_issues = select_archive_page("dev-completed") if status_filter == "Completed" else issues_df.copy()
+        if status_filter not in ("All Active", "Completed"):
             filtered_issues = filtered_issues[filtered_issues["status"] == status_filter]
         if difficulty_filter:
             filtered_issues = filtered_issues[filtered_issues["difficulty"].isin(difficulty_filter)]
@@ -43,9 +47,7 @@ def show_ai_developer_dashboard(current_user_email):
                 # ✅ FIX: Properly check if unassigned
                 if row["status"] == "Open" and (pd.isna(row["assigned_to"]) or row["assigned_to"] == ""):
                     if st.button(f"🟡 Start Working on Issue #{row['id']}", key=f"start-{row['id']}"):
-                        issues_df.at[index, "status"] = "In Progress"
-                        issues_df.at[index, "assigned_to"] = assigned_label
-                        issues_df.to_csv(ISSUES_CSV, index=False)
+                        update_issue(row["id"], "In Progress", assigned_to=assigned_label)
                         st.success(f"Issue #{row['id']} assigned to you.")
                         st.rerun()
 
@@ -57,9 +59,11 @@ def show_ai_developer_dashboard(current_user_email):
 
         my_issues = issues_df[issues_df["assigned_to"] == assigned_label]
 
-        if my_issues.empty:
+        if my_issues.empty and completed == 0:
             st.info("You haven’t claimed or been assigned any issues yet.")
         else:
+            if completed:
+                st.caption(f"✅ {completed} completed issue(s) archived — pick \"Completed\" in the Issues tab to view them.")
             for index, row in my_issues.iterrows():
                 st.markdown(f"**#{row['id']}** — {row['title']} ({row['difficulty']})")
                 st.write(row["description"])
@@ -67,8 +71,7 @@ def show_ai_developer_dashboard(current_user_email):
 
                 if row["status"] == "In Progress":
                     if st.button(f"✅ Mark Completed - Issue #{row['id']}", key=f"complete-{row['id']}"):
-                        issues_df.at[index, "status"] = "Completed"
-                        issues_df.to_csv(ISSUES_CSV, index=False)
+                        update_issue(row["id"], "Completed")
                         st.success(f"Issue #{row['id']} marked as completed.")
                         st.rerun()
                 st.divider()
@@ -78,8 +81,7 @@ def show_ai_developer_dashboard(current_user_email):
         st.subheader("📊 Your Contribution Insights")
 
         my_issues = issues_df[issues_df["assigned_to"] == assigned_label]
-        total = len(my_issues)
-        completed = len(my_issues[my_issues["status"] == "Completed"])
+        total = len(my_issues) + completed
         in_progress = len(my_issues[my_issues["status"] == "In Progress"])
 
         completion_rate = round((completed / total) * 100, 2) if total > 0 else 0.0
@@ -89,9 +91,9 @@ def show_ai_developer_dashboard(current_user_email):
         col2.metric("✅ Completed", completed)
         col3.metric("📈 Completion Rate", f"{completion_rate}%")
 
-        if not my_issues.empty:
-            chart_data = my_issues.groupby(["difficulty", "status"]).size().unstack(fill_value=0)
-            st.bar_chart(chart_data)
+        if total > 0:
+            chart_data = count_issues_by(["difficulty", "status"], assigned_to=assigned_label)
+            st.bar_chart(chart_data.pivot(index="difficulty", columns="status", values="count").fillna(0))
         else:
             st.info("No contribution data yet.")
 
@@ -105,18 +107,23 @@ def show_ai_developer_dashboard(current_user_email):
             submit = st.form_submit_button("Send Help Request")
 
             if submit and help_query.strip():
-                if os.path.exists(HELP_REQUESTS_CSV):
-                    help_df = pd.read_csv(HELP_REQUESTS_CSV)
+                try:
+                    with admission.admit("help_request", current_user_email, write=True):
+                        if os.path.exists(HELP_REQUESTS_CSV):
+                            help_df = pd.read_csv(HELP_REQUESTS_CSV)
+                        else:
+                            help_df = pd.DataFrame(columns=["email", "developer", "query", "timestamp"])
+
+                        new_row = pd.DataFrame([{
+                            "email": current_user_email,
+                            "developer": developer_name,
+                            "query": help_query.strip(),
+                            "timestamp": pd.Timestamp.now()
+                        }])
+
+                        help_df = pd.concat([help_df, new_row], ignore_index=True)
+                        help_df.to_csv(HELP_REQUESTS_CSV, index=False)
+                except AdmissionRejected as e:
+                    st.warning(str(e))
                 else:
-                    help_df = pd.DataFrame(columns=["email", "developer", "query", "timestamp"])
-
-                new_row = pd.DataFrame([{
-                    "email": current_user_email,
-                    "developer": developer_name,
-                    "query": help_query.strip(),
-                    "timestamp": pd.Timestamp.now()
-                }])
-
-                help_df = pd.concat([help_df, new_row], ignore_index=True)
-                help_df.to_csv(HELP_REQUESTS_CSV, index=False)
-                st.success("✅ Your request has been sent to your Tech Lead.")
+                    st.success("✅ Your request has been sent to your Tech Lead.")
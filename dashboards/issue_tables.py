@@ -0,0 +1,41 @@
+import pandas as pd
+import streamlit as st
+
+from issue_store import load_hot_issues, load_archive_page, archive_summary, ISSUE_COLUMNS
+
+ARCHIVE_PAGE_SIZE = 50
+
+
+def select_archive_page(key):
+    """Shows a page picker for the Completed archive and returns only the chosen page."""
+    total = archive_summary()["total"]
+    if total == 0:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+
+    pages = (total + ARCHIVE_PAGE_SIZE - 1) // ARCHIVE_PAGE_SIZE
+    page = st.number_input(f"Completed issues page (of {pages})", min_value=1, max_value=pages, value=1,
+                           key=f"{key}-archive-page")
+    return load_archive_page(page - 1, ARCHIVE_PAGE_SIZE)
+
+
+def show_issues_table(key, newest_first=False):
+    """
+    Shows every issue: the hot partition in full, then the Completed archive
+    one page at a time so the archive is never loaded as a whole.
+    """
+    hot_df = load_hot_issues()
+    if newest_first:
+        hot_df = hot_df.iloc[::-1]
+
+    st.markdown("#### 🔥 Active Issues")
+    if not hot_df.empty:
+        st.dataframe(hot_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No active issues.")
+
+    st.markdown("#### ✅ Completed Issues")
+    archive_page = select_archive_page(key)
+    if not archive_page.empty:
+        st.dataframe(archive_page, use_container_width=True, hide_index=True)
+    else:
+        st.info("No completed issues yet.")
@@ -0,0 +1,53 @@
+import streamlit as st
+
+from reports import submit_report, job_status, job_error, job_version, get_job, read_report
+
+STATUS_BADGES = {
+    "queued": "🕒 Queued",
+    "running": "⚙️ Running",
+    "done": "✅ Ready",
+    "failed": "❌ Failed",
+    "unknown": "❔ Unknown",
+}
+
+
+def show_report_panel(colleges, key):
+    """
+    Lets the user queue per-college progress reports and download them when ready.
+    Job IDs are kept in session state; status comes from the job registry only.
+    """
+    # Superseded jobs are dropped from the registry, so forget them here too
+    jobs = [job_id for job_id in st.session_state.get("report_jobs", []) if get_job(job_id) is not None]
+    st.session_state.report_jobs = jobs
+
+    college = st.selectbox("College", colleges, key=f"{key}-college") if len(colleges) > 1 else colleges[0]
+    col1, col2 = st.columns(2)
+    if col1.button("📑 Generate Report", key=f"{key}-generate"):
+        job_id = submit_report(college)
+        if job_id not in jobs:
+            jobs.append(job_id)
+        st.success(f"Report for {college} queued.")
+    # Re-running the script is enough to refresh job status
+    col2.button("🔄 Refresh Status", key=f"{key}-refresh")
+
+    if not jobs:
+        st.info("No reports requested yet.")
+        return
+
+    for job_id in reversed(jobs):
+        job = get_job(job_id)
+        if job is None:
+            continue
+        status = job_status(job_id)
+        version = job_version(job_id) if status == "done" else job["version"]
+        st.markdown(f"**{job['college']}** — {STATUS_BADGES[status]} · requested {job['submitted']:%H:%M:%S} · data version `{version}`")
+
+        if status == "done":
+            dl1, dl2 = st.columns(2)
+            dl1.download_button("⬇️ CSV", read_report(job_id, "csv"), file_name=f"{job['college']}_report.csv",
+                                mime="text/csv", key=f"{key}-csv-{job_id}")
+            dl2.download_button("⬇️ HTML", read_report(job_id, "html"), file_name=f"{job['college']}_report.html",
+                                mime="text/html", key=f"{key}-html-{job_id}")
+        elif status == "failed":
+            st.error(f"Report failed: {job_error(job_id)}")
+        st.divider()
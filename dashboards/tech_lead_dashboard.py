@@ -3,8 +3,12 @@ import pandas as pd
 import altair as alt
 import os
 
+from admission import controller as admission, AdmissionRejected
+from issue_store import load_hot_issues, load_active_issues, archive_summary, count_issues_by, add_issue, update_issue
+from dashboards.issue_tables import show_issues_table
+from dashboards.report_panel import show_report_panel
+
 USERS_CSV = "data/users.csv"
-ISSUES_CSV = "data/issues.csv"
 HELP_REQUESTS_CSV = "data/help_requests.csv"
 
 def show_tech_lead_dashboard(college_name):
@@ -18,7 +22,7 @@ def show_tech_lead_dashboard(college_name):
     tech_lead_label = f"Tech Lead - {st.session_state.name}"
     st.title("🧑‍🏫 Tech Lead Dashboard")
 
-    tab1, tab2, tab3, tab4 = st.tabs(["👥 Interns", "🛠 Issues & Help", "📄 My Issues", "🐞 Raise Issue"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["👥 Interns", "🛠 Issues & Help", "📄 My Issues", "🐞 Raise Issue", "📑 Reports"])
 
     # ------------------- 👥 Interns Tab -------------------
     with tab1:
@@ -41,13 +45,9 @@ def show_tech_lead_dashboard(college_name):
         # 📂 Program Issues
         with tab_prog:
             st.markdown("### 🔍 Pending Program Issues")
-            if os.path.exists(ISSUES_CSV):
-                issues_df = pd.read_csv(ISSUES_CSV)
-            else:
-                issues_df = pd.DataFrame(columns=["id", "title", "description", "difficulty", "status", "assigned_to", "submitter"])
-
-            pending_df = issues_df[issues_df["status"].isin(["Open", "In Progress"])]
-            difficulty_filter = st.multiselect("Filter by Difficulty", options=issues_df["difficulty"].unique(), default=issues_df["difficulty"].unique())
+            # Reads only the hot partition; Completed issues live in the archive
+            pending_df = load_active_issues()
+            difficulty_filter = st.multiselect("Filter by Difficulty", options=pending_df["difficulty"].unique(), default=pending_df["difficulty"].unique())
             keyword = st.text_input("Search by keyword in title/description")
 
             filtered_df = pending_df[
@@ -66,15 +66,12 @@ def show_tech_lead_dashboard(college_name):
 
                     if row["status"] == "Open":
                         if st.button(f"🟡 Mark In Progress - Issue #{row['id']}", key=f"inprogress-{row['id']}"):
-                            issues_df.at[index, "status"] = "In Progress"
-                            issues_df.at[index, "assigned_to"] = tech_lead_label
-                            issues_df.to_csv(ISSUES_CSV, index=False)
+                            update_issue(row["id"], "In Progress", assigned_to=tech_lead_label)
                             st.success(f"Issue #{row['id']} marked In Progress.")
                             st.rerun()
                     elif row["status"] == "In Progress" and row["assigned_to"] == tech_lead_label:
                         if st.button(f"🔁 Submit Merge Request - Issue #{row['id']}", key=f"mr-{row['id']}"):
-                            issues_df.at[index, "status"] = "Merge Request Submitted"
-                            issues_df.to_csv(ISSUES_CSV, index=False)
+                            update_issue(row["id"], "Merge Request Submitted")
                             st.success(f"Issue #{row['id']} marked as Merge Request Submitted.")
                             st.rerun()
                     st.divider()
@@ -96,95 +93,78 @@ def show_tech_lead_dashboard(college_name):
         # 📋 All Issues Table
         with tab_table:
             st.markdown("### 📋 All Issues")
-            if os.path.exists(ISSUES_CSV):
-                issues_df = pd.read_csv(ISSUES_CSV)
-                st.dataframe(issues_df, use_container_width=True, hide_index=True)
-            else:
-                st.info("No issues available.")
+            show_issues_table("techlead-all")
 
         # 📊 Donut Charts
         with tab_charts:
             st.markdown("### 📊 Issue Insights")
-            if os.path.exists(ISSUES_CSV):
-                issues_df = pd.read_csv(ISSUES_CSV)
-                if not issues_df.empty:
-                    difficulty_data = issues_df.groupby("difficulty").size().reset_index(name="count")
-                    status_data = issues_df.groupby("status").size().reset_index(name="count")
-
-                    difficulty_chart = alt.Chart(difficulty_data).mark_arc(innerRadius=60).encode(
-                        theta="count:Q",
-                        color=alt.Color("difficulty:N"),
-                        tooltip=["difficulty:N", "count:Q"]
-                    ).properties(title="By Difficulty", width=300, height=300)
-
-                    status_chart = alt.Chart(status_data).mark_arc(innerRadius=60).encode(
-                        theta="count:Q",
-                        color=alt.Color("status:N"),
-                        tooltip=["status:N", "count:Q"]
-                    ).properties(title="By Status", width=300, height=300)
-
-                    st.altair_chart(difficulty_chart | status_chart, use_container_width=True)
-                else:
-                    st.info("No data to visualize.")
+            difficulty_data = count_issues_by(["difficulty"])
+            status_data = count_issues_by(["status"])
+            if not difficulty_data.empty:
+                difficulty_chart = alt.Chart(difficulty_data).mark_arc(innerRadius=60).encode(
+                    theta="count:Q",
+                    color=alt.Color("difficulty:N"),
+                    tooltip=["difficulty:N", "count:Q"]
+                ).properties(title="By Difficulty", width=300, height=300)
+
+                status_chart = alt.Chart(status_data).mark_arc(innerRadius=60).encode(
+                    theta="count:Q",
+                    color=alt.Color("status:N"),
+                    tooltip=["status:N", "count:Q"]
+                ).properties(title="By Status", width=300, height=300)
+
+                st.altair_chart(difficulty_chart | status_chart, use_container_width=True)
             else:
-                st.info("Issue file not found.")
+                st.info("No data to visualize.")
 
     # ------------------- 📄 My Issues Tab -------------------
     with tab3:
         st.subheader("📄 Issues Assigned to You")
 
-        if os.path.exists(ISSUES_CSV):
-            issues_df = pd.read_csv(ISSUES_CSV)
-            my_issues = issues_df[issues_df["assigned_to"] == tech_lead_label]
+        # Actionable issues come from the hot partition; completed ones only as archived counts
+        issues_df = load_hot_issues()
+        my_issues = issues_df[issues_df["assigned_to"] == tech_lead_label]
+        archived = archive_summary()["counts"]
+        my_archived = archived[archived["assigned_to"] == tech_lead_label]
 
-            if my_issues.empty:
-                st.info("You haven’t claimed or been assigned any issues yet.")
-            else:
-                for index, row in my_issues.iterrows():
-                    st.markdown(f"**#{row['id']}** — {row['title']} ({row['difficulty']})")
-                    st.write(row["description"])
-                    st.write(f"Status: `{row['status']}`")
-
-                    if row["status"] == "In Progress":
-                        if st.button(f"🔁 Submit Merge Request - Issue #{row['id']}", key=f"techlead-mr-{row['id']}"):
-                            issues_df.at[index, "status"] = "Merge Request Submitted"
-                            issues_df.to_csv(ISSUES_CSV, index=False)
-                            st.success(f"Issue #{row['id']} marked as Merge Request Submitted.")
-                            st.rerun()
-
-                    elif row["status"] == "Merge Request Submitted":
-                        if st.button(f"✅ Mark Completed - Issue #{row['id']}", key=f"techlead-complete-{row['id']}"):
-                            issues_df.at[index, "status"] = "Completed"
-                            issues_df.to_csv(ISSUES_CSV, index=False)
-                            st.success(f"Issue #{row['id']} marked as Completed.")
-                            st.rerun()
-
-                    st.divider()
-
-                # Insights
-                total = len(my_issues)
-                completed = len(my_issues[my_issues["status"] == "Completed"])
-                merge_ready = len(my_issues[my_issues["status"] == "Merge Request Submitted"])
-                in_progress = len(my_issues[my_issues["status"] == "In Progress"])
-                completion_rate = round((completed / total) * 100, 2) if total > 0 else 0.0
-
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Total Assigned", total)
-                col2.metric("Completed", completed)
-                col3.metric("Completion Rate", f"{completion_rate}%")
-
-                chart_data = my_issues.groupby(["difficulty", "status"]).size().unstack(fill_value=0)
-                st.bar_chart(chart_data)
+        if my_issues.empty and my_archived.empty:
+            st.info("You haven’t claimed or been assigned any issues yet.")
         else:
-            st.info("No issues available.")
+            for index, row in my_issues.iterrows():
+                st.markdown(f"**#{row['id']}** — {row['title']} ({row['difficulty']})")
+                st.write(row["description"])
+                st.write(f"Status: `{row['status']}`")
+
+                if row["status"] == "In Progress":
+                    if st.button(f"🔁 Submit Merge Request - Issue #{row['id']}", key=f"techlead-mr-{row['id']}"):
+                        update_issue(row["id"], "Merge Request Submitted")
+                        st.success(f"Issue #{row['id']} marked as Merge Request Submitted.")
+                        st.rerun()
+
+                elif row["status"] == "Merge Request Submitted":
+                    if st.button(f"✅ Mark Completed - Issue #{row['id']}", key=f"techlead-complete-{row['id']}"):
+                        update_issue(row["id"], "Completed")
+                        st.success(f"Issue #{row['id']} marked as Completed.")
+                        st.rerun()
+
+                st.divider()
+
+            # Insights
+            completed = int(my_archived["count"].sum())
+            total = len(my_issues) + completed
+            completion_rate = round((completed / total) * 100, 2) if total > 0 else 0.0
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total Assigned", total)
+            col2.metric("Completed", completed)
+            col3.metric("Completion Rate", f"{completion_rate}%")
+
+            chart_data = count_issues_by(["difficulty", "status"], assigned_to=tech_lead_label)
+            st.bar_chart(chart_data.pivot(index="difficulty", columns="status", values="count").fillna(0))
 
     # ------------------- 🐞 Raise Issue Tab -------------------
     with tab4:
         st.subheader("Raise a New Issue")
-        if os.path.exists(ISSUES_CSV):
-            issues_df = pd.read_csv(ISSUES_CSV)
-        else:
-            issues_df = pd.DataFrame(columns=["id", "title", "description", "difficulty", "status", "assigned_to", "submitter"])
 
         with st.form("raise_issue_techlead_form", clear_on_submit=True):
             title = st.text_input("Issue Title")
@@ -196,23 +176,19 @@ def show_tech_lead_dashboard(college_name):
                 if not title:
                     st.warning("Please enter a title for the issue.")
                 else:
-                    new_id = issues_df["id"].max() + 1 if not issues_df.empty else 1
-                    new_issue = pd.DataFrame([{
-                        "id": new_id,
-                        "title": title,
-                        "description": description,
-                        "difficulty": difficulty,
-                        "status": "Open",
-                        "assigned_to": "",
-                        "submitter": st.session_state.name
-                    }])
-                    issues_df = pd.concat([issues_df, new_issue], ignore_index=True)
-                    issues_df.to_csv(ISSUES_CSV, index=False)
-                    st.success("✅ Issue raised successfully!")
+                    try:
+                        with admission.admit("raise_issue", st.session_state.get("email"), write=True):
+                            add_issue(title, description, difficulty, st.session_state.name)
+                    except AdmissionRejected as e:
+                        st.warning(str(e))
+                    else:
+                        st.success("✅ Issue raised successfully!")
 
         st.divider()
         st.subheader("All Raised Issues")
-        if not issues_df.empty:
-            st.dataframe(issues_df.iloc[::-1], use_container_width=True, hide_index=True)
-        else:
-            st.info("No issues raised yet.")
+        show_issues_table("techlead-raised", newest_first=True)
+
+    # ------------------- 📑 Reports Tab -------------------
+    with tab5:
+        st.subheader(f"📑 Progress Report for {college_name}")
+        show_report_panel([college_name], key="techlead-reports")
@@ -0,0 +1,197 @@
+import os
+import shutil
+import threading
+
+import pandas as pd
+
+# Hot partition: every issue that is not Completed. Active views only read this.
+ISSUES_CSV = "data/issues.csv"
+# Cold partition: Completed issues, gzip-compressed; only ever grown by atomic replacement.
+ARCHIVE_CSV = "data/issues_archive.csv.gz"
+
+ISSUE_COLUMNS = ["id", "title", "description", "difficulty", "status", "assigned_to", "submitter"]
+ACTIVE_STATUSES = ["Open", "In Progress"]
+ARCHIVE_CHUNK_SIZE = 5000
+SUMMARY_COLUMNS = ["difficulty", "status", "assigned_to"]
+# Text columns stay strings even when every value is empty (pandas would infer float64)
+TEXT_DTYPES = {col: "object" for col in ["title", "description", "difficulty", "status", "assigned_to", "submitter"]}
+
+_write_lock = threading.RLock()
+_summary_cache = {"key": None, "summary": None}
+
+
+def _empty_issues():
+    return pd.DataFrame(columns=ISSUE_COLUMNS)
+
+
+def _archive_key():
+    """Identifies the current archive contents; changes whenever it is appended to."""
+    if not os.path.exists(ARCHIVE_CSV):
+        return None
+    stat = os.stat(ARCHIVE_CSV)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _stage_hot(hot_df):
+    """Writes the next hot file beside the current one; `os.replace` makes it live."""
+    tmp_path = f"{ISSUES_CSV}.tmp"
+    hot_df.to_csv(tmp_path, index=False)
+    return tmp_path
+
+
+def _write_hot(hot_df):
+    """Replaces the hot file atomically so readers never see a half-written CSV."""
+    os.replace(_stage_hot(hot_df), ISSUES_CSV)
+
+
+def _read_issues(path, usecols=None, **kwargs):
+    dtypes = {col: dtype for col, dtype in TEXT_DTYPES.items() if usecols is None or col in usecols}
+    return pd.read_csv(path, usecols=usecols, dtype=dtypes, **kwargs)
+
+
+def _group_counts(df):
+    return df.groupby(SUMMARY_COLUMNS, dropna=False).size().reset_index(name="count")
+
+
+def _merge_counts(frames):
+    return pd.concat(frames, ignore_index=True).groupby(SUMMARY_COLUMNS, dropna=False)["count"].sum().reset_index()
+
+
+def _append_to_archive(rows):
+    summary = archive_summary()
+    # Rows can already be archived if a previous move stopped before the hot file was replaced
+    rows = rows.loc[~rows["id"].isin(summary["ids"]), ISSUE_COLUMNS]
+    if rows.empty:
+        return
+
+    # Build the grown archive beside the live one and swap it in, so an interrupted
+    # write can never leave a torn gzip member in the archive readers use
+    tmp_path = f"{ARCHIVE_CSV}.tmp"
+    if os.path.exists(ARCHIVE_CSV):
+        shutil.copyfile(ARCHIVE_CSV, tmp_path)
+        # Appending writes another gzip member; readers treat it as one stream
+        rows.to_csv(tmp_path, index=False, header=False, mode="a", compression="gzip")
+    else:
+        rows.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, ARCHIVE_CSV)
+
+    # Fold the new rows into the cached summary instead of rescanning the archive
+    ids = summary["ids"] | {int(i) for i in rows["id"]}
+    counts = _merge_counts([summary["counts"], _group_counts(rows)])
+    _summary_cache.update(key=_archive_key(), summary={
+        "counts": counts, "total": int(counts["count"].sum()), "ids": ids, "max_id": max(ids, default=0)
+    })
+
+
+def _move_completed(hot_df):
+    """Moves Completed rows out of `hot_df` into the archive. Returns the remaining hot rows."""
+    completed = hot_df["status"] == "Completed"
+    if not completed.any():
+        return hot_df
+    # Stage the hot file first so the only step after the archive append is an atomic rename
+    remaining = hot_df[~completed]
+    tmp_path = _stage_hot(remaining)
+    _append_to_archive(hot_df[completed])
+    os.replace(tmp_path, ISSUES_CSV)
+    return remaining
+
+
+def load_hot_issues():
+    """Loads the hot partition (all non-Completed issues)."""
+    if not os.path.exists(ISSUES_CSV):
+        return _empty_issues()
+
+    hot_df = _read_issues(ISSUES_CSV)
+    if (hot_df["status"] == "Completed").any():
+        # Older data files kept Completed issues inline; archive them once
+        with _write_lock:
+            hot_df = _move_completed(_read_issues(ISSUES_CSV))
+    return hot_df.reset_index(drop=True)
+
+
+def load_active_issues():
+    """Loads only Open and In Progress issues."""
+    hot_df = load_hot_issues()
+    return hot_df[hot_df["status"].isin(ACTIVE_STATUSES)]
+
+
+def load_archive_page(page, page_size):
+    """Loads one page of the archive without decompressing the rows after it."""
+    if not os.path.exists(ARCHIVE_CSV):
+        return _empty_issues()
+    start = page * page_size
+    return _read_issues(ARCHIVE_CSV, skiprows=range(1, start + 1), nrows=page_size)
+
+
+def archive_summary():
+    """
+    Returns archived issue counts grouped by difficulty, status and assignee,
+    plus the set of archived IDs. Appends update the cache in place; the archive
+    is only rescanned when the cache is cold or the file was changed elsewhere.
+    """
+    key = _archive_key()
+    if _summary_cache["summary"] is not None and _summary_cache["key"] == key:
+        return _summary_cache["summary"]
+
+    counts = pd.DataFrame(columns=SUMMARY_COLUMNS + ["count"])
+    ids = set()
+    if key is not None:
+        parts = []
+        for chunk in _read_issues(ARCHIVE_CSV, usecols=["id"] + SUMMARY_COLUMNS, chunksize=ARCHIVE_CHUNK_SIZE):
+            parts.append(_group_counts(chunk))
+            ids.update(int(i) for i in chunk["id"].dropna())
+        if parts:
+            counts = _merge_counts(parts)
+
+    summary = {"counts": counts, "total": int(counts["count"].sum()), "ids": ids, "max_id": max(ids, default=0)}
+    _summary_cache.update(key=key, summary=summary)
+    return summary
+
+
+def count_issues_by(columns, assigned_to=None):
+    """Issue counts across both partitions grouped by `columns`, without loading the archive."""
+    hot_df = load_hot_issues()
+    archived = archive_summary()["counts"]
+    if assigned_to is not None:
+        hot_df = hot_df[hot_df["assigned_to"] == assigned_to]
+        archived = archived[archived["assigned_to"] == assigned_to]
+
+    hot_counts = hot_df.groupby(columns).size().reset_index(name="count")
+    combined = pd.concat([hot_counts, archived[columns + ["count"]]], ignore_index=True)
+    return combined.groupby(columns)["count"].sum().reset_index()
+
+
+def add_issue(title, description, difficulty, submitter):
+    """Appends a new Open issue to the hot partition and returns its ID."""
+    with _write_lock:
+        hot_df = load_hot_issues()
+        max_id = max(int(hot_df["id"].max()) if not hot_df.empty else 0, archive_summary()["max_id"])
+        new_id = max_id + 1
+
+        new_issue = pd.DataFrame([{
+            "id": new_id,
+            "title": title,
+            "description": description,
+            "difficulty": difficulty,
+            "status": "Open",
+            "assigned_to": "",
+            "submitter": submitter
+        }])
+        hot_df = pd.concat([hot_df, new_issue], ignore_index=True)
+        _write_hot(hot_df)
+        return new_id
+
+
+def update_issue(issue_id, status, assigned_to=None):
+    """Sets the status (and optionally assignee) of a hot issue. Completed issues move to the archive."""
+    with _write_lock:
+        hot_df = load_hot_issues()
+        mask = hot_df["id"] == issue_id
+        hot_df.loc[mask, "status"] = status
+        if assigned_to is not None:
+            hot_df.loc[mask, "assigned_to"] = assigned_to
+
+        if status == "Completed":
+            _move_completed(hot_df)
+        else:
+            _write_hot(hot_df)
@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 import os
 
+from admission import controller as admission, AdmissionRejected
+
 USER_CSV = "data/users.csv"
 UPLOAD_FOLDER = "uploads/offer_letters"
 
@@ -35,25 +37,38 @@ with st.form("registration_form"):
         elif not offer_letter:
             st.warning("📄 Please upload your offer letter to proceed.")
         else:
-            # Save uploaded offer letter
-            safe_email = email.replace("@", "_at_").replace(".", "_dot_")
-            offer_path = os.path.join(UPLOAD_FOLDER, f"{safe_email}.pdf")
-            with open(offer_path, "wb") as f:
-                f.write(offer_letter.getbuffer())
-
-            # Create new user entry
-            new_user = pd.DataFrame([{
-                "email": email,
-                "password": password,
-                "role": role,
-                "name": name,
-                "college": college,
-                "offer_letter": offer_path
-            }])
-
-            # Save to CSV
-            users_df = pd.concat([users_df, new_user], ignore_index=True)
-            users_df.to_csv(USER_CSV, index=False)
-
-            st.success("✅ Registration successful! You can now log in.")
-            st.balloons()
+            try:
+                with admission.admit("register", email, write=True):
+                    # Re-read under the write slot so a concurrent registration isn't overwritten
+                    if os.path.exists(USER_CSV):
+                        users_df = pd.read_csv(USER_CSV)
+                    registered = email not in users_df["email"].values
+
+                    if registered:
+                        # Save uploaded offer letter
+                        safe_email = email.replace("@", "_at_").replace(".", "_dot_")
+                        offer_path = os.path.join(UPLOAD_FOLDER, f"{safe_email}.pdf")
+                        with open(offer_path, "wb") as f:
+                            f.write(offer_letter.getbuffer())
+
+                        # Create new user entry
+                        new_user = pd.DataFrame([{
+                            "email": email,
+                            "password": password,
+                            "role": role,
+                            "name": name,
+                            "college": college,
+                            "offer_letter": offer_path
+                        }])
+
+                        # Save to CSV
+                        users_df = pd.concat([users_df, new_user], ignore_index=True)
+                        users_df.to_csv(USER_CSV, index=False)
+            except AdmissionRejected as e:
+                st.warning(str(e))
+            else:
+                if registered:
+                    st.success("✅ Registration successful! You can now log in.")
+                    st.balloons()
+                else:
+                    st.warning("⚠️ This email is already registered. Try logging in.")
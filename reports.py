@@ -0,0 +1,261 @@
+import glob
+import hashlib
+import html
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import pandas as pd
+
+from issue_store import ISSUES_CSV, ARCHIVE_CSV
+
+USERS_CSV = "data/users.csv"
+HELP_REQUESTS_CSV = "data/help_requests.csv"
+REPORTS_FOLDER = "reports"
+REPORT_WORKERS = 2
+
+# Files whose contents determine a report; any change produces a new dataset version
+DATASET_FILES = [USERS_CSV, ISSUES_CSV, ARCHIVE_CSV, HELP_REQUESTS_CSV]
+
+_lock = threading.RLock()
+_executor = None
+# Only the latest job per college is kept: {job_id: job} plus {college: job_id}
+_jobs = {}
+_latest = {}
+
+
+def dataset_version():
+    """Short hash of the data files' modification times and sizes."""
+    parts = []
+    for path in DATASET_FILES:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+def _report_prefix(college):
+    # The slug keeps file names readable; the hash keeps "A B" and "A-B" apart
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", str(college)).strip("_") or "college"
+    digest = hashlib.sha1(str(college).encode()).hexdigest()[:8]
+    return os.path.join(REPORTS_FOLDER, f"{slug}_{digest}_")
+
+
+def _report_paths(college, version):
+    base = f"{_report_prefix(college)}{version}"
+    return {"csv": f"{base}.csv", "html": f"{base}.html"}
+
+
+def _remove_files(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _remove_stale_reports(college, keep_paths):
+    """Deletes report files for `college` from superseded dataset versions."""
+    keep = set(keep_paths.values())
+    _remove_files(p for p in glob.glob(f"{glob.escape(_report_prefix(college))}*") if p not in keep)
+
+
+def _chart_html(chart, element_id="chart"):
+    """
+    Embeds an Altair chart without chart.to_html(), which writes the spec into a
+    <script> block verbatim. Escaping <, > and & as JSON unicode escapes keeps
+    free-text data (member names) from closing the script tag.
+    """
+    import altair as alt
+
+    spec = chart.to_json(indent=None)
+    spec = spec.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+    return (
+        f'<div id="{element_id}"></div>'
+        f'<script src="https://cdn.jsdelivr.net/npm/vega@{alt.VEGA_VERSION}"></script>'
+        f'<script src="https://cdn.jsdelivr.net/npm/vega-lite@{alt.VEGALITE_VERSION}"></script>'
+        f'<script src="https://cdn.jsdelivr.net/npm/vega-embed@{alt.VEGAEMBED_VERSION}"></script>'
+        f'<script>vegaEmbed("#{element_id}", {spec});</script>'
+    )
+
+
+def _read_csv(path):
+    return pd.read_csv(path) if os.path.exists(path) else pd.DataFrame()
+
+
+def build_college_report(college, paths):
+    """
+    Runs in a worker process. Aggregates users, issues and help requests for one
+    college into a per-member CSV and an HTML summary with charts.
+
+    The files are named after the dataset version seen when the job was queued, but
+    the data is read here; the version actually read is returned so the UI can show it.
+    """
+    import altair as alt
+
+    version = dataset_version()
+    users_df = _read_csv(USERS_CSV)
+    issues_df = pd.concat([_read_csv(ISSUES_CSV), _read_csv(ARCHIVE_CSV)], ignore_index=True)
+    help_df = _read_csv(HELP_REQUESTS_CSV)
+
+    members = users_df[users_df["college"] == college] if not users_df.empty else users_df
+    rows = []
+    for _, user in members.iterrows():
+        label = f"{user['role']} - {user['name']}"
+        assigned = issues_df[issues_df["assigned_to"] == label] if not issues_df.empty else issues_df
+        rows.append({
+            "name": user["name"],
+            "email": user["email"],
+            "role": user["role"],
+            "assigned": len(assigned),
+            "in_progress": int((assigned["status"] == "In Progress").sum()) if not assigned.empty else 0,
+            "merge_requests": int((assigned["status"] == "Merge Request Submitted").sum()) if not assigned.empty else 0,
+            "completed": int((assigned["status"] == "Completed").sum()) if not assigned.empty else 0,
+            "help_requests": int((help_df["email"] == user["email"]).sum()) if not help_df.empty else 0,
+        })
+    summary_df = pd.DataFrame(rows, columns=["name", "email", "role", "assigned", "in_progress",
+                                             "merge_requests", "completed", "help_requests"])
+
+    os.makedirs(REPORTS_FOLDER, exist_ok=True)
+    summary_df.to_csv(paths["csv"], index=False)
+
+    # College names are free text from registration; escape them wherever they land in HTML
+    safe_college = html.escape(str(college))
+    status_data = summary_df.melt(id_vars=["name"], value_vars=["in_progress", "merge_requests", "completed"],
+                                  var_name="status", value_name="count")
+    chart = alt.Chart(status_data).mark_bar().encode(
+        x=alt.X("name:N", title="Member"),
+        y=alt.Y("count:Q", title="Issues"),
+        color=alt.Color("status:N", title="Status"),
+        tooltip=["name:N", "status:N", "count:Q"]
+    ).properties(title=f"Issue Progress — {college}", width=600, height=300)
+
+    totals = summary_df[["assigned", "in_progress", "merge_requests", "completed", "help_requests"]].sum()
+    page = (
+        f"<html><head><meta charset='utf-8'><title>{safe_college} Progress Report</title></head><body>"
+        f"<h1>{safe_college} Progress Report</h1>"
+        f"<p>Generated {datetime.now():%Y-%m-%d %H:%M}</p>"
+        f"{totals.to_frame('total').to_html()}"
+        f"{_chart_html(chart)}"
+        f"{summary_df.to_html(index=False)}"
+        "</body></html>"
+    )
+    with open(paths["html"], "w", encoding="utf-8") as f:
+        f.write(page)
+
+    return {"paths": paths, "version": version}
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # Forking the multi-threaded Streamlit server can deadlock; start clean workers instead
+        _executor = ProcessPoolExecutor(max_workers=REPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def _reset_executor():
+    """Drops a pool broken by a dead worker so the next job starts a fresh one."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _supersede(college, job_id, paths):
+    """Forgets the previous job for `college` and deletes its report files."""
+    old_id = _latest.get(college)
+    _latest[college] = job_id
+    if old_id is not None and old_id != job_id:
+        old = _jobs.pop(old_id, None)
+        if old is not None and old["future"] is not None and not old["future"].done():
+            # Still running; clean up once it has written its files
+            old["future"].add_done_callback(lambda _, p=old["paths"]: _remove_files(p.values()))
+    _remove_stale_reports(college, paths)
+
+
+def submit_report(college):
+    """
+    Queues a report for `college` and returns its job ID. A job for the same college
+    and dataset version is reused instead of being rebuilt; older versions are dropped.
+    """
+    version = dataset_version()
+    job_id = f"{college}@{version}"
+    paths = _report_paths(college, version)
+
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is not None and job_status(job_id) != "failed":
+            return job_id
+
+        _supersede(college, job_id, paths)
+        job = {
+            "college": college,
+            "version": version,
+            "paths": paths,
+            "future": None,
+            "pool": None,
+            "error": None,
+            "submitted": datetime.now(),
+        }
+        if not all(os.path.exists(p) for p in paths.values()):
+            try:
+                job["pool"] = _get_executor()
+                job["future"] = job["pool"].submit(build_college_report, college, paths)
+            except BrokenProcessPool as e:
+                _reset_executor()
+                job["error"] = e
+        _jobs[job_id] = job
+    return job_id
+
+
+def job_status(job_id):
+    """One of "queued", "running", "done", "failed" or "unknown". Never touches the data files."""
+    job = _jobs.get(job_id)
+    if job is None:
+        return "unknown"
+    if job["error"] is not None:
+        return "failed"
+    future = job["future"]
+    if future is None:
+        return "done"
+    if not future.done():
+        return "running" if future.running() else "queued"
+    if isinstance(future.exception(), BrokenProcessPool):
+        # A worker died (OOM, signal); replace the pool unless that already happened
+        with _lock:
+            if _executor is job["pool"]:
+                _reset_executor()
+    return "failed" if future.exception() is not None else "done"
+
+
+def job_error(job_id):
+    """The exception a failed job raised, if any."""
+    job = _jobs.get(job_id)
+    if job is None:
+        return None
+    if job["error"] is not None:
+        return job["error"]
+    future = job["future"]
+    return future.exception() if future is not None and future.done() else None
+
+
+def job_version(job_id):
+    """Dataset version the finished report was built from (may be newer than the one queued)."""
+    job = _jobs[job_id]
+    future = job["future"]
+    if future is not None and future.done() and future.exception() is None:
+        return future.result()["version"]
+    return job["version"]
+
+
+def get_job(job_id):
+    return _jobs.get(job_id)
+
+
+def read_report(job_id, fmt):
+    """Returns the bytes of a finished report in `fmt` ("csv" or "html")."""
+    with open(_jobs[job_id]["paths"][fmt], "rb") as f:
+        return f.read()
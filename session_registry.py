@@ -0,0 +1,165 @@
+import logging
+import sys
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Matches the 30-minute login timeout enforced in app.main()
+IDLE_TIMEOUT = 30 * 60
+SWEEP_INTERVAL = 60
+ANONYMOUS_ROLE = "Anonymous"
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value):
+    """Approximate memory footprint of a session-state value in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class SessionRegistry:
+    """
+    Tracks the approximate memory footprint and last activity of every session.
+    A daemon sweeper closes sessions idle longer than `idle_timeout`, which drops
+    their session state, and forgets sessions the browser has already closed.
+    The close itself is handed to the runtime's event loop, which owns the sessions.
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, sweep_interval=SWEEP_INTERVAL):
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.evicted = 0
+        self.last_sweep = None
+        self.last_error = None
+
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._sweeper = None
+
+    def touch(self, session_id, role, session_state):
+        """Records activity for a session along with its current state size."""
+        size = sum(estimate_size(k) + estimate_size(v) for k, v in session_state.to_dict().items())
+        with self._lock:
+            self._sessions[session_id] = {
+                "role": role or ANONYMOUS_ROLE,
+                "bytes": size,
+                "last_active": time.monotonic(),
+            }
+
+    def _close(self, runtime, session_id, seen_active):
+        """Runs on the event loop thread: Runtime.close_session is not thread-safe."""
+        with self._lock:
+            info = self._sessions.get(session_id)
+            if info is None or info["last_active"] != seen_active:
+                # The session reran after the sweep picked it; it is no longer idle
+                return
+            del self._sessions[session_id]
+        if not runtime.is_active_session(session_id):
+            return
+        info = runtime._session_mgr.get_active_session_info(session_id)
+        close_client = getattr(info.client, "close", None) if info is not None else None
+        if close_client is not None:
+            # Closing the websocket makes the browser show its reconnect prompt, which starts
+            # a fresh session at the login page, instead of leaving a page that ignores input
+            close_client()
+        # Releases the session's state, widgets and uploaded-file/media refs
+        runtime.close_session(session_id)
+        with self._lock:
+            self.evicted += 1
+
+    def _close_logged(self, runtime, session_id, seen_active):
+        try:
+            self._close(runtime, session_id, seen_active)
+        except Exception as e:
+            logger.exception("Failed to evict idle session %s", session_id)
+            self.last_error = f"{datetime.now():%H:%M:%S} {type(e).__name__}: {e}"
+
+    def sweep(self):
+        """Schedules idle sessions for eviction and forgets closed ones. Returns the number scheduled."""
+        now = time.monotonic()
+        try:
+            runtime = Runtime.instance()
+        except RuntimeError:
+            runtime = None
+
+        with self._lock:
+            gone = [sid for sid in self._sessions if runtime is not None and not runtime.is_active_session(sid)]
+            for sid in gone:
+                del self._sessions[sid]
+            # Idle entries stay registered until their close runs, so a rerun in between cancels it
+            idle = [(sid, info["last_active"]) for sid, info in self._sessions.items()
+                    if not info.get("evicting") and now - info["last_active"] > self.idle_timeout]
+            for sid, _ in idle:
+                if runtime is None:
+                    del self._sessions[sid]
+                else:
+                    self._sessions[sid]["evicting"] = True
+
+        if runtime is not None and idle:
+            eventloop = runtime._get_async_objs().eventloop
+            for sid, seen_active in idle:
+                eventloop.call_soon_threadsafe(self._close_logged, runtime, sid, seen_active)
+        return len(idle)
+
+    def _run_sweeper(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                # Keep the sweeper alive and retry next interval, but make the failure visible
+                logger.exception("Session sweep failed")
+                self.last_error = f"{datetime.now():%H:%M:%S} {type(e).__name__}: {e}"
+            else:
+                self.last_sweep = datetime.now()
+                self.last_error = None
+
+    def start_sweeper(self):
+        with self._lock:
+            if self._sweeper is None:
+                self._sweeper = threading.Thread(target=self._run_sweeper, name="session-sweeper", daemon=True)
+                self._sweeper.start()
+
+    def stats(self):
+        """Live session count and total approximate memory per role."""
+        with self._lock:
+            rows = {}
+            for info in self._sessions.values():
+                row = rows.setdefault(info["role"], {"role": info["role"], "sessions": 0, "memory_kb": 0.0})
+                row["sessions"] += 1
+                row["memory_kb"] += info["bytes"] / 1024
+            return {
+                "roles": [{**row, "memory_kb": round(row["memory_kb"], 1)} for row in sorted(rows.values(), key=lambda r: r["role"])],
+                "total_sessions": len(self._sessions),
+                "total_kb": round(sum(info["bytes"] for info in self._sessions.values()) / 1024, 1),
+                "evicted": self.evicted,
+                "last_sweep": self.last_sweep,
+                "last_error": self.last_error,
+            }
+
+
+# Module-level singleton shared by every session in the process
+registry = SessionRegistry()
+
+
+def track_current_session():
+    """Registers activity for the session running this script and ensures the sweeper is running."""
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    role = st.session_state.get("role") if st.session_state.get("logged_in") else None
+    registry.touch(ctx.session_id, role, st.session_state)
+    registry.start_sweeper()